@@ -0,0 +1 @@
+"""FreeDraw Canvas drawing application."""
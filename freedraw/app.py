@@ -0,0 +1,597 @@
+"""FreeDraw Canvas application window.
+
+FreeDrawApp owns the window, the drawing canvas and the toolbar. All mutable
+drawing state lives on one slotted DrawState instance, so the handlers that
+run at motion-event frequency only do attribute loads.
+
+Stroke storage format:
+    (line_id, pts, color, size)
+where pts is an (n, 2) float64 NumPy array in current canvas coordinates.
+Each stroke is a single Tk line item; strokes that fall out of the undo
+history are baked into a PIL image shown through one canvas image item.
+Line items freed by undo, baking or clearing are hidden and reused for the
+next stroke instead of being deleted.
+"""
+from collections import deque
+import tkinter as tk
+from tkinter import filedialog, colorchooser
+
+import numpy as np
+import ttkbootstrap as tb
+from PIL import Image, ImageDraw, ImageTk
+
+from freedraw.kernels import rescale, simplify_rdp
+
+
+def _paint_stroke(draw, pts, color, width):
+    draw.line(pts.ravel().tolist(), fill=color, width=width, joint="curve")
+    r = width / 2
+    for x, y in (pts[0], pts[-1]):
+        draw.ellipse((x - r, y - r, x + r, y + r), fill=color)
+
+
+class DrawState:
+    """Mutable state shared by the FreeDrawApp event handlers."""
+
+    __slots__ = (
+        "brush_color", "brush_size", "eraser_size", "drawing", "using_eraser",
+        "last_x", "last_y", "strokes", "redo_strokes", "current_stroke", "free_lines",
+        "stroke_buf", "stroke_len",
+        "pending_points", "pending_cursor", "redraw_scheduled",
+        "bake_image", "bake_x0", "bake_y0", "bake_scale", "bake_photo", "bake_view_scheduled",
+        "zoom_level", "origin_x", "origin_y", "scroll_region",
+        "pending_scale", "pending_dx", "pending_dy", "zoom_scheduled",
+        "toolbar", "toolbar_shown",
+    )
+
+    def __init__(self, history_limit):
+        self.brush_color = "black"
+        self.brush_size = 5
+        self.eraser_size = 10
+        self.drawing = False
+        self.using_eraser = False
+        self.last_x, self.last_y = None, None
+
+        self.strokes = deque(maxlen=history_limit)
+        self.redo_strokes = deque(maxlen=history_limit)
+        self.current_stroke = None
+        self.free_lines = deque()
+        self.stroke_buf = np.empty(64, dtype=np.float64)
+        self.stroke_len = 0
+
+        self.pending_points = []
+        self.pending_cursor = None
+        self.redraw_scheduled = False
+
+        self.bake_image = None
+        self.bake_x0, self.bake_y0 = 0, 0
+        self.bake_scale = 1.0
+        self.bake_photo = None
+        self.bake_view_scheduled = False
+
+        self.zoom_level = 1.0
+        self.origin_x, self.origin_y = 0.0, 0.0
+        self.scroll_region = (0, 0, 1000, 700)
+        self.pending_scale = 1.0
+        self.pending_dx, self.pending_dy = 0.0, 0.0
+        self.zoom_scheduled = False
+
+        self.toolbar = None
+        self.toolbar_shown = False
+
+
+class FreeDrawApp:
+    """Freehand drawing window with undo/redo, eraser, zoom and export.
+
+    ``theme`` is a ttkbootstrap theme name and ``title`` the window title;
+    everything else is shared by every front-end script.
+    """
+
+    history_limit = 200
+    bake_batch = 50
+    bake_max_pixels = 4096 * 4096
+    zoom_factor = 1.1
+    min_dist_sq = 2.0
+    rdp_epsilon = 0.75
+
+    def __init__(self, theme="darkly", title="DrawPad"):
+        self.style = tb.Style(theme=theme)
+        self.root = self.style.master
+        self.root.title(title)
+        self.root.geometry("1000x900")
+        self.root.configure(bg="#1f1f1f")
+
+        self.state = DrawState(self.history_limit)
+        self._queue_point = self.state.pending_points.append
+
+        self._build_canvas()
+
+        self.tools_button = tb.Button(
+            self.root, text="Tools", command=self.toggle_toolbar, bootstyle="dark", width=8
+        )
+        self.tools_button.pack(side=tk.BOTTOM, anchor="w", padx=12, pady=(0, 12))
+        self.root.bind("<F1>", self.toggle_toolbar)
+
+        self._bind_canvas()
+
+    def run(self):
+        """Start the Tk main loop; returns when the window is closed."""
+        self.root.mainloop()
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    def _build_canvas(self):
+        main_frame = tb.Frame(self.root, bootstyle="secondary", padding=8)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        canvas_frame = tb.Frame(main_frame, padding=(10, 10), bootstyle="secondary")
+        canvas_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.h_scroll = tk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL)
+        self.v_scroll = tk.Scrollbar(canvas_frame, orient=tk.VERTICAL)
+
+        self.canvas = canvas = tk.Canvas(
+            canvas_frame,
+            bg="white",
+            width=900,
+            height=550,
+            xscrollcommand=self._on_xview,
+            yscrollcommand=self._on_yview,
+            highlightthickness=0
+        )
+
+        self.h_scroll.config(command=canvas.xview)
+        self.v_scroll.config(command=canvas.yview)
+
+        self.h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+        self.v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas_bg = canvas["bg"]
+
+        self.bake_item = canvas.create_image(0, 0, anchor=tk.NW)
+        self.cursor_circle = canvas.create_oval(0, 0, 0, 0, outline="#777", state=tk.HIDDEN)
+        canvas.configure(scrollregion=self.state.scroll_region)
+
+    def _bind_canvas(self):
+        canvas = self.canvas
+        canvas.bind("<Button-1>", self.start_draw)
+        canvas.bind("<B1-Motion>", self.draw)
+        canvas.bind("<ButtonRelease-1>", self.stop_draw)
+        canvas.bind("<Motion>", self.draw_cursor_circle)
+        canvas.bind("<Enter>", self._enter_canvas)
+        canvas.bind("<Leave>", self._hide_cursor_circle)
+
+        canvas.bind("<MouseWheel>", self.zoom_windows)
+        canvas.bind("<Button-4>", self.zoom_windows)
+        canvas.bind("<Button-5>", self.zoom_windows)
+
+    def _build_toolbar(self):
+        toolbar_container = tb.Frame(self.root, bootstyle="secondary", padding=8)
+
+        inner = tb.Frame(toolbar_container, bootstyle="light", padding=6)
+        inner.pack(fill=tk.X, padx=6)
+
+        btn_group = tb.Frame(inner)
+        btn_group.pack(side=tk.LEFT, padx=10, pady=6)
+
+        btn_opts = {"bootstyle": "dark", "width": 12}
+
+        tb.Button(btn_group, text="Color", command=self.set_color, **btn_opts).grid(row=0, column=0, padx=4)
+        tb.Button(btn_group, text="Eraser", command=self.use_eraser, **btn_opts).grid(row=0, column=1, padx=4)
+        tb.Button(btn_group, text="Undo", command=self.undo, **btn_opts).grid(row=0, column=2, padx=4)
+        tb.Button(btn_group, text="Redo", command=self.redo, **btn_opts).grid(row=0, column=3, padx=4)
+        tb.Button(btn_group, text="Clear", command=self.clear_canvas, **btn_opts).grid(row=0, column=4, padx=4)
+        tb.Button(btn_group, text="Save", command=self.save_canvas, **btn_opts).grid(row=0, column=5, padx=4)
+
+        slider_box = tb.Frame(inner, bootstyle="secondary")
+        slider_box.pack(side=tk.RIGHT, padx=8)
+
+        tb.Label(slider_box, text="Brush Size", bootstyle="inverse").pack(anchor="e")
+        brush_slider = tb.Scale(
+            slider_box, from_=1, to=20, orient=tk.HORIZONTAL,
+            command=self.set_brush_size, bootstyle="info", length=180
+        )
+        brush_slider.set(self.state.brush_size)
+        brush_slider.pack(pady=4)
+
+        tb.Label(slider_box, text="Eraser Size", bootstyle="inverse").pack(anchor="e")
+        eraser_slider = tb.Scale(
+            slider_box, from_=1, to=50, orient=tk.HORIZONTAL,
+            command=self.set_eraser_size, bootstyle="info", length=180
+        )
+        eraser_slider.set(self.state.eraser_size)
+        eraser_slider.pack(pady=4)
+
+        return toolbar_container
+
+    def toggle_toolbar(self, event=None):
+        """Show or hide the toolbar, building its widgets on first use."""
+        S = self.state
+        if S.toolbar is None:
+            S.toolbar = self._build_toolbar()
+
+        if S.toolbar_shown:
+            S.toolbar.pack_forget()
+        else:
+            S.toolbar.pack(fill=tk.X, side=tk.BOTTOM, padx=12, pady=(6, 12))
+        S.toolbar_shown = not S.toolbar_shown
+
+    # ------------------------------------------------------------------
+    # Cursor preview and motion coalescing
+    # ------------------------------------------------------------------
+    def _update_cursor_circle(self, x, y):
+        S = self.state
+        size = S.eraser_size if S.using_eraser else S.brush_size
+        self.canvas.coords(
+            self.cursor_circle,
+            x - size/2, y - size/2,
+            x + size/2, y + size/2
+        )
+
+    def _enter_canvas(self, event):
+        # On Windows, <MouseWheel> is delivered to the focused widget.
+        self.canvas.itemconfigure(self.cursor_circle, state=tk.NORMAL)
+        self.canvas.focus_set()
+
+    def _hide_cursor_circle(self, event):
+        self.canvas.itemconfigure(self.cursor_circle, state=tk.HIDDEN)
+
+    def _flush_motion(self):
+        S = self.state
+        S.redraw_scheduled = False
+        if S.pending_cursor is None:
+            return
+
+        c = self.canvas
+        ox, oy = c.canvasx(0), c.canvasy(0)
+        queued = S.pending_points
+
+        if queued:
+            if S.current_stroke:
+                accepted = []
+                append = accepted.append
+                limit = self.min_dist_sq
+                lx, ly = S.last_x, S.last_y
+                for ex, ey in queued:
+                    x, y = ex + ox, ey + oy
+                    dx, dy = x - lx, y - ly
+                    if dx*dx + dy*dy < limit:
+                        continue
+                    append(x)
+                    append(y)
+                    lx, ly = x, y
+                if accepted:
+                    n = S.stroke_len
+                    m = n + len(accepted)
+                    buf = S.stroke_buf
+                    if m > len(buf):
+                        buf = S.stroke_buf = self._grow_stroke_buf(buf, n, m)
+                    buf[n:m] = accepted
+                    S.stroke_len = m
+                    c.coords(S.current_stroke[0], *buf[:m].tolist())
+                S.last_x, S.last_y = lx, ly
+            queued.clear()
+
+        ex, ey = S.pending_cursor
+        S.pending_cursor = None
+        self._update_cursor_circle(ex + ox, ey + oy)
+
+    def draw_cursor_circle(self, event):
+        """Queue a cursor-preview update for the next idle cycle."""
+        S = self.state
+        S.pending_cursor = (event.x, event.y)
+        if not S.redraw_scheduled:
+            S.redraw_scheduled = True
+            self.root.after_idle(self._flush_motion)
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+    def _acquire_line(self, coords, color, size, smooth):
+        canvas = self.canvas
+        free = self.state.free_lines
+        if free:
+            line_id = free.pop()
+            canvas.itemconfigure(line_id, width=size, fill=color, smooth=smooth, state=tk.NORMAL)
+            canvas.coords(line_id, *coords)
+        else:
+            line_id = canvas.create_line(
+                *coords,
+                width=size, fill=color,
+                capstyle=tk.ROUND, smooth=smooth, tags=("stroke",)
+            )
+        canvas.tag_lower(line_id, self.cursor_circle)
+        return line_id
+
+    def _release_line(self, line_id):
+        # Hidden items keep their id and are revived by _acquire_line, so the
+        # number of Tk line items never exceeds the live history.
+        self.canvas.itemconfigure(line_id, state=tk.HIDDEN)
+        self.state.free_lines.append(line_id)
+
+    @staticmethod
+    def _grow_stroke_buf(buf, used, needed):
+        capacity = len(buf)
+        while capacity < needed:
+            capacity *= 2
+        grown = np.empty(capacity, dtype=np.float64)
+        grown[:used] = buf[:used]
+        return grown
+
+    def start_draw(self, event):
+        """Begin a stroke as a single unsmoothed line item."""
+        S = self.state
+        canvas = self.canvas
+        S.drawing = True
+        x = S.last_x = canvas.canvasx(event.x)
+        y = S.last_y = canvas.canvasy(event.y)
+        size = S.eraser_size if S.using_eraser else S.brush_size
+        color = self.canvas_bg if S.using_eraser else S.brush_color
+
+        line_id = self._acquire_line((x, y, x, y), color, size, smooth=False)
+        S.stroke_buf[:4] = (x, y, x, y)
+        S.stroke_len = 4
+        S.current_stroke = (line_id, color, size)
+
+    def draw(self, event):
+        """Queue a stroke sample; the idle flush extends the line."""
+        if self.state.drawing:
+            self._queue_point((event.x, event.y))
+        self.draw_cursor_circle(event)
+
+    def stop_draw(self, event):
+        """Simplify, smooth and commit the current stroke to the history."""
+        S = self.state
+        if S.drawing:
+            self._flush_motion()
+            S.drawing = False
+            if S.current_stroke:
+                line_id, color, size = S.current_stroke
+                n = S.stroke_len
+                pts = simplify_rdp(S.stroke_buf[:n].reshape(-1, 2), self.rdp_epsilon)
+                if len(pts) * 2 < n:
+                    self.canvas.coords(line_id, *pts.ravel().tolist())
+                self.canvas.itemconfigure(line_id, smooth=True)
+                self._push_stroke((line_id, pts, color, size))
+                S.current_stroke = None
+            S.redo_strokes.clear()
+
+    def _push_stroke(self, stroke):
+        strokes = self.state.strokes
+        if len(strokes) == strokes.maxlen:
+            self._bake_strokes([strokes.popleft() for _ in range(min(self.bake_batch, len(strokes)))])
+        strokes.append(stroke)
+
+    def undo(self):
+        """Remove the most recent stroke and keep it for redo."""
+        S = self.state
+        if S.strokes:
+            stroke = S.strokes.pop()
+            self._release_line(stroke[0])
+            S.redo_strokes.append(stroke)
+
+    def redo(self):
+        """Recreate the most recently undone stroke."""
+        S = self.state
+        if S.redo_strokes:
+            _, pts, color, size = S.redo_strokes.pop()
+            new_id = self._acquire_line(pts.ravel().tolist(), color, size, smooth=True)
+            self._push_stroke((new_id, pts, color, size))
+
+    # ------------------------------------------------------------------
+    # Baked layer
+    # ------------------------------------------------------------------
+    def _ensure_bake_extent(self, x0, y0, x1, y1):
+        # x0..y1 are world-space bounds. The layer is stored at bake_scale
+        # pixels per world unit: at least the zoom the strokes were drawn at,
+        # and only lowered when the whole layer would exceed bake_max_pixels.
+        S = self.state
+        img = S.bake_image
+        scale = max(1.0, S.zoom_level)
+        if img is not None:
+            w, h = img.size
+            bs = S.bake_scale
+            scale = max(scale, bs)
+            ux0, uy0 = min(x0, S.bake_x0 / bs), min(y0, S.bake_y0 / bs)
+            ux1, uy1 = max(x1, (S.bake_x0 + w) / bs), max(y1, (S.bake_y0 + h) / bs)
+        else:
+            ux0, uy0, ux1, uy1 = x0, y0, x1, y1
+
+        area = (ux1 - ux0) * (uy1 - uy0)
+        budget = self.bake_max_pixels
+        if area * scale * scale > budget:
+            if img is not None and area * bs * bs <= budget:
+                scale = bs
+            else:
+                # Leave headroom so the next few bakes fit without resampling.
+                scale = 0.9 * (budget / area) ** 0.5
+
+        if img is not None:
+            bx, by = S.bake_x0, S.bake_y0
+            if scale != bs:
+                k = scale / bs
+                img = img.resize(
+                    (max(1, round(w * k)), max(1, round(h * k))),
+                    Image.Resampling.BOX if k < 1 else Image.Resampling.BILINEAR
+                )
+                bx, by = round(bx * k), round(by * k)
+
+        x0, y0 = int(np.floor(x0 * scale)), int(np.floor(y0 * scale))
+        x1, y1 = int(np.ceil(x1 * scale)), int(np.ceil(y1 * scale))
+        if img is not None:
+            w, h = img.size
+            if x0 >= bx and y0 >= by and x1 <= bx + w and y1 <= by + h:
+                S.bake_image, S.bake_x0, S.bake_y0, S.bake_scale = img, bx, by, scale
+                return
+            x0, y0 = min(x0, bx), min(y0, by)
+            x1, y1 = max(x1, bx + w), max(y1, by + h)
+
+        grown = Image.new("RGB", (x1 - x0, y1 - y0), self.canvas_bg)
+        if img is not None:
+            grown.paste(img, (bx - x0, by - y0))
+        S.bake_image, S.bake_x0, S.bake_y0, S.bake_scale = grown, x0, y0, scale
+
+    def _bake_strokes(self, batch):
+        S = self.state
+        zoom = S.zoom_level
+        world = [(pts - (S.origin_x, S.origin_y)) / zoom for _, pts, _, _ in batch]
+        pad = max(size for *_, size in batch) / zoom + 1
+        self._ensure_bake_extent(
+            min(w[:, 0].min() for w in world) - pad,
+            min(w[:, 1].min() for w in world) - pad,
+            max(w[:, 0].max() for w in world) + pad,
+            max(w[:, 1].max() for w in world) + pad
+        )
+
+        scale = S.bake_scale
+        draw = ImageDraw.Draw(S.bake_image)
+        for (_, _, color, size), w in zip(batch, world):
+            w *= scale
+            w -= (S.bake_x0, S.bake_y0)
+            _paint_stroke(draw, w, color, max(1, round(size / zoom * scale)))
+
+        for line_id, *_ in batch:
+            self._release_line(line_id)
+        self._schedule_bake_view()
+
+    def _render_bake(self, x0, y0, w, h, out_scale=1.0):
+        # Output pixel (u, v) shows canvas point (x0 + u / out_scale, y0 + v / out_scale).
+        S = self.state
+        k = S.bake_scale / S.zoom_level
+        step = k / out_scale
+        return S.bake_image.transform(
+            (w, h), Image.Transform.AFFINE,
+            (step, 0, (x0 - S.origin_x) * k - S.bake_x0, 0, step, (y0 - S.origin_y) * k - S.bake_y0),
+            resample=Image.Resampling.BILINEAR, fillcolor=self.canvas_bg
+        )
+
+    def _refresh_bake_view(self):
+        S = self.state
+        S.bake_view_scheduled = False
+        if S.bake_image is None:
+            return
+
+        canvas = self.canvas
+        x0, y0 = canvas.canvasx(0), canvas.canvasy(0)
+        S.bake_photo = ImageTk.PhotoImage(self._render_bake(x0, y0, canvas.winfo_width(), canvas.winfo_height()))
+        canvas.itemconfigure(self.bake_item, image=S.bake_photo)
+        canvas.coords(self.bake_item, x0, y0)
+
+    def _schedule_bake_view(self):
+        S = self.state
+        if S.bake_image is not None and not S.bake_view_scheduled:
+            S.bake_view_scheduled = True
+            self.root.after_idle(self._refresh_bake_view)
+
+    def _on_xview(self, *args):
+        self.h_scroll.set(*args)
+        self._schedule_bake_view()
+
+    def _on_yview(self, *args):
+        self.v_scroll.set(*args)
+        self._schedule_bake_view()
+
+    # ------------------------------------------------------------------
+    # Tools
+    # ------------------------------------------------------------------
+    def set_color(self):
+        """Pick a brush colour and leave eraser mode."""
+        S = self.state
+        S.using_eraser = False
+        color = colorchooser.askcolor()[1]
+        if color:
+            S.brush_color = color
+
+    def use_eraser(self):
+        """Switch to the eraser, which paints with the canvas background."""
+        self.state.using_eraser = True
+
+    def set_brush_size(self, val):
+        # Scale passes float-like strings, so int(val) alone would fail.
+        self.state.brush_size = int(float(val))
+
+    def set_eraser_size(self, val):
+        self.state.eraser_size = int(float(val))
+
+    def clear_canvas(self):
+        """Remove every stroke, the baked layer and the undo/redo history."""
+        S = self.state
+        self.canvas.itemconfigure("stroke", state=tk.HIDDEN)
+        S.free_lines.extend(line_id for line_id, *_ in S.strokes)
+        S.strokes.clear()
+        S.redo_strokes.clear()
+        S.bake_image = S.bake_photo = None
+        self.canvas.itemconfigure(self.bake_item, image="")
+
+    def save_canvas(self):
+        """Export the scroll region as a PNG or JPEG image.
+
+        The image is downscaled when the zoomed scroll region would exceed
+        bake_max_pixels.
+        """
+        S = self.state
+        file = filedialog.asksaveasfilename(
+            defaultextension=".png",
+            filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg")]
+        )
+        if not file:
+            return
+
+        x0, y0, x1, y1 = S.scroll_region
+        k = min(1.0, (self.bake_max_pixels / ((x1 - x0) * (y1 - y0))) ** 0.5)
+        w, h = max(1, int((x1 - x0) * k)), max(1, int((y1 - y0) * k))
+        if S.bake_image is None:
+            img = Image.new("RGB", (w, h), self.canvas_bg)
+        else:
+            img = self._render_bake(x0, y0, w, h, k)
+
+        draw = ImageDraw.Draw(img)
+        for _, pts, color, size in S.strokes:
+            _paint_stroke(draw, (pts - (x0, y0)) * k, color, max(1, round(size * k)))
+        img.save(file)
+
+    # ------------------------------------------------------------------
+    # Zoom
+    # ------------------------------------------------------------------
+    def _apply_zoom(self):
+        S = self.state
+        self._flush_motion()
+        S.zoom_scheduled = False
+        s, dx, dy = S.pending_scale, S.pending_dx, S.pending_dy
+        S.pending_scale, S.pending_dx, S.pending_dy = 1.0, 0.0, 0.0
+        S.zoom_level *= s
+        S.origin_x, S.origin_y = S.origin_x * s + dx, S.origin_y * s + dy
+
+        coords = self.canvas.coords
+        for line_id, pts, _, _ in S.strokes:
+            rescale(pts, s, dx, dy)
+            coords(line_id, *pts.ravel().tolist())
+        for _, pts, _, _ in S.redo_strokes:
+            rescale(pts, s, dx, dy)
+
+        if S.current_stroke:
+            n = S.stroke_len
+            live = S.stroke_buf[:n]
+            rescale(live.reshape(-1, 2), s, dx, dy)
+            coords(S.current_stroke[0], *live.tolist())
+            S.last_x, S.last_y = S.last_x * s + dx, S.last_y * s + dy
+
+        x0, y0, x1, y1 = S.scroll_region
+        S.scroll_region = (x0 * s + dx, y0 * s + dy, x1 * s + dx, y1 * s + dy)
+        self.canvas.configure(scrollregion=S.scroll_region)
+        self._refresh_bake_view()
+
+    def zoom_windows(self, event):
+        """Ctrl+wheel zoom about the pointer; ticks are applied once per idle cycle."""
+        S = self.state
+        if event.state & 0x0004:  # Ctrl key
+            zoom_in = event.num == 4 or event.delta > 0
+            scale = self.zoom_factor if zoom_in else 1 / self.zoom_factor
+            cx, cy = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+            S.pending_scale *= scale
+            S.pending_dx = S.pending_dx * scale + cx * (1 - scale)
+            S.pending_dy = S.pending_dy * scale + cy * (1 - scale)
+            if not S.zoom_scheduled:
+                S.zoom_scheduled = True
+                self.root.after_idle(self._apply_zoom)
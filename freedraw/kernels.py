@@ -0,0 +1,119 @@
+"""Numeric kernels for stroke point arrays.
+
+Points are float64 arrays of shape (n, 2). The kernels are compiled with
+Numba at import time when it is installed; otherwise equivalent NumPy
+versions are used, so callers never need to know which one they got.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _rdp_mask_numpy(pts, eps_sq):
+    n = len(pts)
+    keep = np.zeros(n, dtype=np.bool_)
+    keep[0] = keep[n - 1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
+
+        a = pts[lo]
+        dx, dy = pts[hi] - a
+        rel = pts[lo + 1:hi] - a
+        seg_sq = dx*dx + dy*dy
+        if seg_sq:
+            dist = (rel[:, 0]*dy - rel[:, 1]*dx) ** 2 / seg_sq
+        else:
+            dist = (rel * rel).sum(axis=1)
+
+        i = int(dist.argmax())
+        if dist[i] > eps_sq:
+            index = lo + 1 + i
+            keep[index] = True
+            stack.append((lo, index))
+            stack.append((index, hi))
+    return keep
+
+
+def _rdp_mask_loop(pts, eps_sq):
+    n = pts.shape[0]
+    keep = np.zeros(n, dtype=np.bool_)
+    keep[0] = True
+    keep[n - 1] = True
+
+    # Every live interval ends on a kept point, so n slots always suffice.
+    stack = np.empty((n, 2), dtype=np.int64)
+    stack[0, 0] = 0
+    stack[0, 1] = n - 1
+    top = 1
+    while top:
+        top -= 1
+        lo = stack[top, 0]
+        hi = stack[top, 1]
+        ax = pts[lo, 0]
+        ay = pts[lo, 1]
+        dx = pts[hi, 0] - ax
+        dy = pts[hi, 1] - ay
+        seg_sq = dx*dx + dy*dy
+
+        max_d = -1.0
+        index = lo
+        for i in range(lo + 1, hi):
+            px = pts[i, 0] - ax
+            py = pts[i, 1] - ay
+            if seg_sq > 0.0:
+                cross = px*dy - py*dx
+                d = cross*cross / seg_sq
+            else:
+                d = px*px + py*py
+            if d > max_d:
+                max_d = d
+                index = i
+
+        if max_d > eps_sq:
+            keep[index] = True
+            stack[top, 0] = lo
+            stack[top, 1] = index
+            top += 1
+            stack[top, 0] = index
+            stack[top, 1] = hi
+            top += 1
+    return keep
+
+
+def _rescale_numpy(pts, scale, dx, dy):
+    np.multiply(pts, scale, out=pts)
+    np.add(pts, (dx, dy), out=pts)
+
+
+def _rescale_loop(pts, scale, dx, dy):
+    for i in range(pts.shape[0]):
+        pts[i, 0] = pts[i, 0] * scale + dx
+        pts[i, 1] = pts[i, 1] * scale + dy
+
+
+# rescale(pts, scale, dx, dy) maps every point to p * scale + (dx, dy) in place.
+# Explicit signatures make Numba compile (or load from cache) at import time
+# instead of inside the first stroke release or zoom tick.
+if njit is not None:
+    _rdp_mask = njit("b1[:](f8[:, :], f8)", cache=True)(_rdp_mask_loop)
+    rescale = njit("void(f8[:, :], f8, f8, f8)", cache=True)(_rescale_loop)
+else:
+    _rdp_mask = _rdp_mask_numpy
+    rescale = _rescale_numpy
+
+
+def simplify_rdp(pts, eps):
+    """Return a Ramer-Douglas-Peucker simplified copy of pts.
+
+    Points closer than ``eps`` to the chord they would be dropped from are
+    removed; the first and last points are always kept.
+    """
+    if len(pts) < 3:
+        return pts.copy()
+    return pts[_rdp_mask(pts, eps * eps)]